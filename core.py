@@ -0,0 +1,290 @@
+import functools
+import math
+from dataclasses import dataclass, field
+from typing import List, Dict, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+# ---------- Data models ----------
+@dataclass(frozen=True, slots=True)
+class Rail:
+    name: str
+    fixed_fee: float
+    variable_fee_pct: float
+    fx_spread_bps: int
+    est_delivery_hours: int
+    send_limit_min: float
+    send_limit_max: float
+    # Derived from fx_spread_bps once, so compute_quote doesn't redo the division
+    fx_spread_pct: float = field(init=False, repr=False, compare=False)
+    fx_spread_mul: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        spread_pct = self.fx_spread_bps / 10000.0
+        object.__setattr__(self, "fx_spread_pct", spread_pct)
+        object.__setattr__(self, "fx_spread_mul", 1 - spread_pct)
+
+@dataclass(frozen=True, slots=True)
+class Corridor:
+    src: str
+    dst: str
+    currency_src: str
+    currency_dst: str
+    rails: Tuple[Rail, ...]
+
+class Quote(NamedTuple):
+    rail: str
+    fixed_fee: float
+    variable_fee: float
+    total_fees_src: float
+    fx_spread_bps: int
+    fx_spread_cost_src: float
+    rate_mid: float
+    rate_customer: float
+    fx_principal: float
+    received_dst: Optional[float]
+    est_delivery_hours: int
+    send_limit_min: float
+    send_limit_max: float
+
+class RailArrays(NamedTuple):
+    # One slot per rail of a corridor, in corridor.rails order
+    fixed_fee: np.ndarray
+    variable_fee_pct: np.ndarray
+    fx_spread_mul: np.ndarray
+    send_limit_min: np.ndarray
+    send_limit_max: np.ndarray
+
+class RailQuotes(NamedTuple):
+    total_fees_src: np.ndarray
+    received_dst: Optional[np.ndarray]
+    within_limits: np.ndarray
+
+# Rails are immutable, so corridors with identical parameters share one instance
+_RAIL_CACHE: Dict[tuple, Rail] = {}
+
+def _shared_rail(*params) -> Rail:
+    rail = _RAIL_CACHE.get(params)
+    if rail is None:
+        rail = _RAIL_CACHE[params] = Rail(*params)
+    return rail
+
+# Shared rail presets
+def rails_standard(
+    agg_bps: int, card_bps: int, swift_bps: int,
+    agg_fixed=1.99, agg_var=0.010, agg_eta=2,
+    card_fixed=2.79, card_var=0.013, card_eta=4,
+    swift_fixed=14.0, swift_var=0.002, swift_eta=24,
+    min_send=10, max_send_agg=5000, max_send_card=3000, max_send_swift=50000
+):
+    return (
+        _shared_rail("Fintech Aggregator", agg_fixed, agg_var, agg_bps, agg_eta, min_send, max_send_agg),
+        _shared_rail("Card Network", card_fixed, card_var, card_bps, card_eta, min_send, max_send_card),
+        _shared_rail("SWIFT", swift_fixed, swift_var, swift_bps, swift_eta, 100, max_send_swift),
+    )
+
+# ---------- Corridors: United States -> Americas ----------
+CORRIDORS: List[Corridor] = [
+    Corridor("United States", "Canada",   "USD", "CAD", rails_standard(70, 90, 30)),
+    Corridor("United States", "Mexico",   "USD", "MXN", rails_standard(90, 120, 40)),
+
+    Corridor("United States", "Guatemala","USD", "GTQ", rails_standard(120, 150, 55)),
+    Corridor("United States", "Honduras", "USD", "HNL", rails_standard(140, 170, 60)),
+    Corridor("United States", "El Salvador","USD","USD", rails_standard(0, 0, 0, swift_fixed=8.0)),
+    Corridor("United States", "Nicaragua","USD", "NIO", rails_standard(150, 180, 65)),
+    Corridor("United States", "Costa Rica","USD","CRC", rails_standard(120, 150, 50)),
+    Corridor("United States", "Panama",   "USD", "USD", rails_standard(0, 0, 0, swift_fixed=8.0)),
+
+    Corridor("United States", "Dominican Republic","USD","DOP", rails_standard(130, 160, 55)),
+    Corridor("United States", "Jamaica", "USD", "JMD", rails_standard(140, 170, 60)),
+    Corridor("United States", "Haiti",   "USD", "HTG", rails_standard(180, 220, 80)),
+    Corridor("United States", "Trinidad & Tobago","USD","TTD", rails_standard(120, 150, 50)),
+
+    Corridor("United States", "Colombia","USD", "COP", rails_standard(100, 130, 40)),
+    Corridor("United States", "Peru",    "USD", "PEN", rails_standard(100, 130, 45)),
+    Corridor("United States", "Chile",   "USD", "CLP", rails_standard(90,  120, 40)),
+    Corridor("United States", "Argentina","USD","ARS", rails_standard(250, 300, 90, swift_eta=48, max_send_agg=3000, max_send_card=2000)),
+    Corridor("United States", "Brazil",  "USD", "BRL", rails_standard(120, 140, 50)),
+    Corridor("United States", "Uruguay", "USD", "UYU", rails_standard(110, 140, 45)),
+    Corridor("United States", "Paraguay","USD", "PYG", rails_standard(140, 170, 60)),
+    Corridor("United States", "Bolivia", "USD", "BOB", rails_standard(120, 150, 50)),
+    Corridor("United States", "Ecuador", "USD", "USD", rails_standard(0, 0, 0, swift_fixed=8.0)),
+]
+
+# Lookup indexes, built once at import
+CORRIDOR_INDEX: Dict[Tuple[str, str], Corridor] = {(c.src, c.dst): c for c in CORRIDORS}
+RAIL_INDEX: Dict[Tuple[str, str], Dict[str, Rail]] = {
+    (c.src, c.dst): {r.name: r for r in c.rails} for c in CORRIDORS
+}
+
+# Picker options; core is imported once per process, unlike the rerun app script
+SRCS: Tuple[str, ...] = tuple(sorted({c.src for c in CORRIDORS}))
+DSTS_BY_SRC: Dict[str, Tuple[str, ...]] = {
+    src: tuple(sorted(c.dst for c in CORRIDORS if c.src == src)) for src in SRCS
+}
+
+# Rail parameters per corridor laid out as arrays, for evaluating every rail at once
+RAIL_ARRAYS: Dict[Tuple[str, str], RailArrays] = {
+    (c.src, c.dst): RailArrays(
+        np.array([r.fixed_fee for r in c.rails], dtype=float),
+        np.array([r.variable_fee_pct for r in c.rails], dtype=float),
+        np.array([r.fx_spread_mul for r in c.rails], dtype=float),
+        np.array([r.send_limit_min for r in c.rails], dtype=float),
+        np.array([r.send_limit_max for r in c.rails], dtype=float),
+    )
+    for c in CORRIDORS
+}
+
+# ---------- Mid-market FX rates ----------
+MID_RATES_BY_SRC: Dict[str, Dict[str, float]] = {
+    "USD": {
+        "CAD": 1.30,
+        "MXN": 19.50,
+        "GTQ": 7.80,
+        "HNL": 24.60,
+        "USD": 1.00,
+        "NIO": 36.70,
+        "CRC": 515.00,
+        "DOP": 59.00,
+        "JMD": 156.00,
+        "HTG": 132.00,
+        "TTD": 6.80,
+        "COP": 4150.00,
+        "PEN": 3.70,
+        "CLP": 910.00,
+        "ARS": 950.00,
+        "BRL": 5.10,
+        "UYU": 39.00,
+        "PYG": 7400.00,
+        "BOB": 6.90,
+    },
+}
+
+def mid_rate(src_ccy: str, dst_ccy: str) -> Optional[float]:
+    rates = MID_RATES_BY_SRC.get(src_ccy)
+    return rates.get(dst_ccy) if rates else None
+
+# ---------- Helpers ----------
+def fmt_money(x: float, ccy: str) -> str:
+    # Half-up rounding to cents (rounded to 6 dp first so 1.005 isn't seen as 100.4999... cents)
+    cents = math.floor(round(abs(x) * 100, 6) + 0.5)
+    value = -cents / 100 if x < 0 and cents else cents / 100
+    symbol = "$" if ccy == "USD" else ""
+    return f"{symbol}{value:,.2f} {ccy}"
+
+# Rail and Quote are immutable, so identical reruns hit the cache instead of recomputing
+@functools.lru_cache(maxsize=512)
+def compute_quote(amount: float, rail: Rail, src_ccy: str, dst_ccy: str) -> Quote:
+    variable_fee = amount * rail.variable_fee_pct
+    fixed_fee = rail.fixed_fee
+    total_fees_src = variable_fee + fixed_fee
+    fx_principal = max(amount - total_fees_src, 0)
+    base_rate = mid_rate(src_ccy, dst_ccy)
+
+    if base_rate is None:
+        customer_rate = None
+        received_dst = None
+        fx_spread_cost_src = 0.0
+    else:
+        if src_ccy == dst_ccy:
+            customer_rate = base_rate
+            fx_spread_cost_src = 0.0
+        else:
+            customer_rate = base_rate * rail.fx_spread_mul
+            # base_rate - customer_rate == base_rate * spread_pct
+            fx_spread_cost_src = fx_principal * base_rate * rail.fx_spread_pct
+        received_dst = fx_principal * customer_rate
+
+    return Quote(
+        rail.name,
+        fixed_fee,
+        variable_fee,
+        total_fees_src,
+        rail.fx_spread_bps,
+        fx_spread_cost_src if base_rate else 0.0,
+        base_rate if base_rate else 0.0,
+        customer_rate if base_rate else 0.0,
+        fx_principal,
+        received_dst if base_rate else None,
+        rail.est_delivery_hours,
+        rail.send_limit_min,
+        rail.send_limit_max,
+    )
+
+def _customer_rates(corridor: Corridor, arrays: RailArrays) -> Optional[np.ndarray]:
+    # Per-rail customer rate, mirroring compute_quote's branches; None when there is no mid rate
+    base_rate = mid_rate(corridor.currency_src, corridor.currency_dst)
+    if base_rate is None:
+        return None
+    if corridor.currency_src == corridor.currency_dst:
+        return np.full_like(arrays.fixed_fee, base_rate)
+    return base_rate * arrays.fx_spread_mul
+
+def _quotes_vectorized(amounts, fixed_fee, variable_fee_pct, customer_rate):
+    # Same operation order as compute_quote, so results match it exactly
+    total_fees_src = amounts * variable_fee_pct + fixed_fee
+    fx_principal = np.maximum(amounts - total_fees_src, 0.0)
+    return total_fees_src, fx_principal * customer_rate
+
+def compute_all_quotes(amount: float, corridor: Corridor) -> RailQuotes:
+    # Same math as compute_quote, evaluated for every rail of the corridor at once
+    arrays = RAIL_ARRAYS[(corridor.src, corridor.dst)]
+    customer_rate = _customer_rates(corridor, arrays)
+    total_fees_src, received_dst = _quotes_vectorized(
+        amount, arrays.fixed_fee, arrays.variable_fee_pct, 0.0 if customer_rate is None else customer_rate
+    )
+    within_limits = (arrays.send_limit_min <= amount) & (amount <= arrays.send_limit_max)
+    return RailQuotes(total_fees_src, None if customer_rate is None else received_dst, within_limits)
+
+# ---------- Batch (analytics) ----------
+def _quotes_batch(amounts, fixed_fee, variable_fee_pct, customer_rate):
+    # Flat arrays, one entry per quote; same operation order as compute_quote
+    n = amounts.size
+    total_fees_src = np.empty(n)
+    received_dst = np.empty(n)
+    for i in range(n):
+        total = amounts[i] * variable_fee_pct[i] + fixed_fee[i]
+        principal = amounts[i] - total
+        if principal < 0:
+            principal = 0.0
+        total_fees_src[i] = total
+        received_dst[i] = principal * customer_rate[i]
+    return total_fees_src, received_dst
+
+@functools.lru_cache(maxsize=None)
+def _quotes_batch_kernel():
+    # numba is optional and slow to import, so only load it when a batch is requested;
+    # without it the NumPy expression is already vectorized
+    try:
+        from numba import njit
+    except ImportError:
+        return _quotes_vectorized
+    return njit(cache=True)(_quotes_batch)
+
+def compute_quotes_batch(
+    amounts, fixed_fee, variable_fee_pct, customer_rate
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Sweep many quotes at once; flat arrays with one entry per quote, which may mix corridors
+    and rails. Returns (total_fees_src, received_dst) arrays."""
+    args = (amounts, fixed_fee, variable_fee_pct, customer_rate)
+    return _quotes_batch_kernel()(*(np.ascontiguousarray(a, dtype=np.float64) for a in args))
+
+def compute_corridor_quotes_batch(amounts, corridor: Corridor) -> RailQuotes:
+    """Quote every rail of ``corridor`` for each amount; arrays are shaped (len(amounts), len(rails))."""
+    arrays = RAIL_ARRAYS[(corridor.src, corridor.dst)]
+    amounts = np.asarray(amounts, dtype=np.float64).reshape(-1, 1)
+    customer_rate = _customer_rates(corridor, arrays)
+
+    shape = np.broadcast_shapes(amounts.shape, arrays.fixed_fee.shape)
+    flat = (
+        np.broadcast_to(a, shape).ravel()
+        for a in (amounts, arrays.fixed_fee, arrays.variable_fee_pct,
+                  0.0 if customer_rate is None else customer_rate)
+    )
+    total_fees_src, received_dst = compute_quotes_batch(*flat)
+    within_limits = (arrays.send_limit_min <= amounts) & (amounts <= arrays.send_limit_max)
+    return RailQuotes(
+        total_fees_src.reshape(shape),
+        None if customer_rate is None else received_dst.reshape(shape),
+        within_limits,
+    )